@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 
+import aiohttp
+from aiohttp.hdrs import USER_AGENT
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_PASSWORD, EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.ssl import get_default_context
 
 from .api import EWeLinkApiClient
 from .const import (
@@ -16,11 +23,15 @@ from .const import (
     APP_ID,
     APP_SECRET,
     CONF_ACCOUNT,
+    CONF_REGION,
     COORDINATOR,
     DOMAIN,
     EWELINK_API_AT_EXPIRED_TS,
+    LEGACY_UNIQUE_ID_PREFIX,
     PLATFORMS,
     REGION_DEFAULT,
+    SESSION,
+    SESSION_CLOSE_UNSUB,
     WS_CLIENT,
 )
 from .coordinator import EWeLinkDataCoordinator
@@ -30,18 +41,76 @@ from .websocket import EWeLinkWebSocketClient
 _LOGGER = logging.getLogger(__name__)
 
 
+def _async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Get the client session shared by all eWeLink config entries.
+
+    eWeLink traffic only goes to a few regional hosts, so a small pool with a
+    long keepalive avoids TLS handshakes on idle reconnects.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    session: aiohttp.ClientSession | None = domain_data.get(SESSION)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=4,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+                ssl=get_default_context(),
+            ),
+            headers={USER_AGENT: SERVER_SOFTWARE},
+            json_serialize=json_dumps,
+        )
+        domain_data[SESSION] = session
+
+    if SESSION_CLOSE_UNSUB not in domain_data:
+
+        async def _async_close_session(event: Event) -> None:
+            domain_data.pop(SESSION_CLOSE_UNSUB, None)
+            if (current := domain_data.pop(SESSION, None)) is not None:
+                await current.close()
+
+        domain_data[SESSION_CLOSE_UNSUB] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_session
+        )
+    return session
+
+
+@callback
+def _async_migrate_unique_id(
+    ent_reg: er.EntityRegistry, entity_entry: er.RegistryEntry
+) -> dict[str, str] | None:
+    """Migrate unique ids created with the misspelled ewelink_lot prefix."""
+    if not entity_entry.unique_id.startswith(LEGACY_UNIQUE_ID_PREFIX):
+        return None
+    new_unique_id = DOMAIN + entity_entry.unique_id.removeprefix(
+        LEGACY_UNIQUE_ID_PREFIX
+    )
+    if existing := ent_reg.async_get_entity_id(
+        entity_entry.domain, DOMAIN, new_unique_id
+    ):
+        _LOGGER.warning(
+            "Cannot migrate %s to unique id %s, already used by %s",
+            entity_entry.entity_id,
+            new_unique_id,
+            existing,
+        )
+        return None
+    return {"new_unique_id": new_unique_id}
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up eWeLink IoT from a config entry."""
-    account = entry.data.get("user_input", {}).get(CONF_ACCOUNT)
-    password = entry.data.get("user_input", {}).get(CONF_PASSWORD)
-    country_code = entry.data.get("user_input", {}).get("CONF_REGION", REGION_DEFAULT)
-    user_data = entry.data.get("user_data", None)
-    at_updated_ts = entry.data.get("at_updated_ts")
-    now_ts = now_timestamp()
+    user_input = entry.data.get("user_input") or {}
+    account = user_input.get(CONF_ACCOUNT)
+    password = user_input.get(CONF_PASSWORD)
+    country_code = user_input.get(CONF_REGION, REGION_DEFAULT)
+    user_data = entry.data.get("user_data")
+    # at_updated_ts is always stored as an int timestamp by the config flow
+    at_updated_ts: int | None = entry.data.get("at_updated_ts")
     is_at_expired = (
-        at_updated_ts + EWELINK_API_AT_EXPIRED_TS < now_ts
-        if isinstance(at_updated_ts, int)
-        else False
+        at_updated_ts is not None
+        and at_updated_ts + EWELINK_API_AT_EXPIRED_TS < now_timestamp()
     )
 
     if (not account) or (not password) or (not country_code) or is_at_expired:
@@ -49,7 +118,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create api client
     api_client = EWeLinkApiClient(
-        session=async_get_clientsession(hass),
+        session=_async_get_session(hass),
         account=account,
         password=password,
         country_code=country_code,
@@ -86,6 +155,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = runtime_data
 
+    await er.async_migrate_entries(
+        hass, entry.entry_id, partial(_async_migrate_unique_id, er.async_get(hass))
+    )
+
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -107,6 +180,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             await runtime_data[COORDINATOR].async_shutdown()
         if WS_CLIENT in runtime_data:
             await runtime_data[WS_CLIENT].stop()
+        # Close the shared session once the last entry is unloaded
+        domain_data = hass.data[DOMAIN]
+        if domain_data.keys() <= {SESSION, SESSION_CLOSE_UNSUB}:
+            if (unsub := domain_data.pop(SESSION_CLOSE_UNSUB, None)) is not None:
+                unsub()
+            if (session := domain_data.pop(SESSION, None)) is not None:
+                await session.close()
 
         _LOGGER.debug("Successfully unloaded eWeLink IoT integration")
 
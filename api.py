@@ -4,70 +4,112 @@ from __future__ import annotations
 
 import asyncio
 import base64
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cached_property
 import hashlib
 import hmac
-import json
 import logging
 from typing import Any
 
 import aiohttp
+import orjson
 
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.exceptions import ConfigEntryAuthFailed
-
-from .const import CONF_COUNTRY_CODE, DEV_MODE, EWELINK_API_MAP, REGION_CN, REGIONS_MAP
-from .utils import deep_get, gen_random_str, is_valid_email, now_timestamp
+from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.json import json_loads
+
+from .const import (
+    COUNTRY_CODE_TO_API_BASE_URL,
+    DEV_MODE,
+    EWELINK_API_AT_EXPIRED_TS,
+    EWELINK_API_MAP,
+    REGION_CN,
+)
+from .uiid import get_uiid_instance
+from .utils import (
+    deep_get,
+    gen_random_str,
+    get_device_uiid,
+    is_valid_email,
+    merge,
+    now_timestamp,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# thingList item types of devices, other types are groups etc.
+DEVICE_ITEM_TYPES = frozenset((1, 2))
+
 
 @dataclass
 class EWeLinkDevice:
-    """Represent an eWeLink device."""
+    """Represent an eWeLink device.
+
+    Static device fields are cached on first access, only ``online`` and
+    ``params`` change after the device is fetched.
+    """
 
     device: dict
+    uiid_instance: Any = field(init=False, repr=False, compare=False)
 
-    @property
+    def __post_init__(self) -> None:
+        """Resolve device uiid instance once."""
+        self.uiid_instance = get_uiid_instance(self.uiid)
+
+    @cached_property
     def device_name(self) -> str:
         """Get device name."""
-        return deep_get(self.device, ["itemData", "name"], "eWeLink device")
+        return deep_get(self.device, ("itemData", "name"), "eWeLink device")
 
-    @property
+    @cached_property
     def model(self) -> str:
         "Get device model."
-        return deep_get(self.device, ["itemData", "params", "model"], None)
+        return deep_get(self.device, ("itemData", "params", "model"), None)
 
-    @property
+    @cached_property
     def brand_name(self) -> str:
         "Get device brand name."
-        return deep_get(self.device, ["itemData", "brandName"], "eWeLink")
+        return deep_get(self.device, ("itemData", "brandName"), "eWeLink")
 
-    @property
+    @cached_property
     def uiid(self) -> str:
         "Get device uiid."
-        return deep_get(self.device, ["itemData", "extra", "uiid"], None)
+        return get_device_uiid(self.device)
 
-    @property
+    @cached_property
     def device_id(self) -> str:
         """Get device id."""
-        return deep_get(self.device, ["itemData", "deviceid"])
+        return deep_get(self.device, ("itemData", "deviceid"))
 
     @property
     def online(self) -> bool:
         """Get device online status."""
-        return deep_get(self.device, ["itemData", "online"], False)
+        return deep_get(self.device, ("itemData", "online"), False)
 
-    @property
+    @cached_property
+    def params(self) -> dict:
+        """Get device params dict, updated in place."""
+        return self.device.setdefault("itemData", {}).setdefault("params", {})
+
+    def update_params(self, params: dict) -> None:
+        """Merge changed params into device params."""
+        merge(self.params, params)
+
+    def set_online(self, online: bool) -> None:
+        """Set device online status."""
+        self.device.setdefault("itemData", {})["online"] = online
+
+    @cached_property
     def manufacturer(self) -> str:
         """Get device manufacturer."""
-        return deep_get(self.device, ["itemData", "extra", "manufacturer"], "ewelink")
+        return deep_get(self.device, ("itemData", "extra", "manufacturer"), "ewelink")
 
-    @property
+    @cached_property
     def apikey(self) -> str:
         """Get device apikey."""
-        return deep_get(self.device, ["itemData", "apikey"])
+        return deep_get(self.device, ("itemData", "apikey"))
 
 
 class RequestMethod(StrEnum):
@@ -112,20 +154,22 @@ class EWeLinkApiClient:
         self.__session = session
         self.__account = account
         self.__password = password
-        self.__app_id = app_id
         self.__country_code = country_code
-        self.__app_id = app_id
-        self.__app_secret = app_secret
+        self.__app_secret = app_secret.encode()
         self.__at_updated_ts = -1
+        self.__at_expired_ts = self.__at_updated_ts + EWELINK_API_AT_EXPIRED_TS
         self.__api_base_url = self.__get_api_base_url()
+        self.__app_id = ""
+        self.__base_headers: dict[str, str] = {}
+        self.__set_app_id(app_id)
         self.__access_token = ""
+        self.__auth_header = ""
+        self.__api_key: str | None = None
+        self.__user_data: dict[str, Any] = {}
         self.__family_list = []
         self.__device_dict: dict[str, EWeLinkDevice] = {}
         if user_data is not None:
-            self.__user_data = user_data
-            self.__access_token = deep_get(user_data, ["at"])
-        else:
-            self.__user_data = {}
+            self.__set_user_data(user_data)
         _LOGGER.info("EWeLinkApiClient init api_url: %s", self.__api_base_url)
 
     def __get_api_base_url(self):
@@ -133,33 +177,43 @@ class EWeLinkApiClient:
         if DEV_MODE:
             return EWELINK_API_MAP[REGION_CN]
 
-        regions = [
-            item["region"]
-            for item in REGIONS_MAP
-            if item[CONF_COUNTRY_CODE] == self.__country_code
-        ]
-        return EWELINK_API_MAP[regions[0]] if len(regions) > 0 else None
+        return COUNTRY_CODE_TO_API_BASE_URL.get(self.__country_code)
+
+    def __set_app_id(self, app_id: str) -> None:
+        """Set app id and the request headers derived from it."""
+        self.__app_id = app_id
+        self.__base_headers = {
+            "X-CK-Appid": app_id,
+            "Content-Type": "application/json",
+        }
+
+    def __set_access_token(self, access_token: str | None) -> None:
+        """Set access token and the bearer authorization derived from it."""
+        self.__access_token = access_token or ""
+        self.__auth_header = f"Bearer {access_token}" if access_token else ""
+
+    def __set_user_data(self, user_data: dict[str, Any]) -> None:
+        """Set login user data and the credentials read from it."""
+        self.__user_data = user_data
+        self.__api_key = deep_get(user_data, ("user", "apikey"))
+        self.__set_access_token(deep_get(user_data, ("at",)))
 
     def __generate_auth(
         self, request_method: RequestMethod, params: dict[str, Any] | None = None
     ) -> str:
-        """Generate signature for API request."""
-        if self.__access_token:
-            return f"Bearer {self.__access_token}"
-
+        """Generate signature for API request without access token."""
         if params is None:
             return ""
 
-        message = ""
+        message: bytes
         if request_method == RequestMethod.GET:
-            sorted_key_list = sorted(params.keys())
-            message = "&".join([f"{key}={params[key]}" for key in sorted_key_list])
+            query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+            message = query.encode()
         else:
-            message = json.dumps(params, separators=(",", ":"))
+            # orjson already serializes to compact utf-8 bytes
+            message = orjson.dumps(params)
 
-        sha256 = hmac.new(
-            self.__app_secret.encode(), message.encode(), digestmod=hashlib.sha256
-        ).digest()
+        sha256 = hmac.new(self.__app_secret, message, digestmod=hashlib.sha256).digest()
 
         return f"Sign {(base64.b64encode(sha256)).decode()}"
 
@@ -168,10 +222,10 @@ class EWeLinkApiClient:
     ) -> dict[str, str]:
         """Get headers for API request."""
         return {
-            "X-CK-Appid": self.__app_id,
+            **self.__base_headers,
             "X-CK-Nonce": gen_random_str(8),
-            "Authorization": self.__generate_auth(request_method, params),
-            "Content-Type": "application/json",
+            "Authorization": self.__auth_header
+            or self.__generate_auth(request_method, params),
         }
 
     def __common_error_handler(self, response_json: dict):
@@ -189,6 +243,7 @@ class EWeLinkApiClient:
     def set_at_updated_ts(self, ts: int):
         """Set at_updated_ts."""
         self.__at_updated_ts = ts
+        self.__at_expired_ts = ts + EWELINK_API_AT_EXPIRED_TS
         return ts
 
     async def login(self) -> dict[str, Any]:
@@ -208,7 +263,7 @@ class EWeLinkApiClient:
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=10),
             ) as response:
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 error = data.get("error")
                 if error != 0:
                     error_msg = data.get("msg")
@@ -224,12 +279,11 @@ class EWeLinkApiClient:
                         )
                 self.__common_error_handler(data)
                 # Extract authentication data
-                user_data = data.get("data", {}).get("user", {})
-                self.__access_token = data.get("data", {}).get("at")
-                self.__app_id = user_data.get("apikey")
+                login_data = data["data"]
+                self.__set_app_id(login_data["user"]["apikey"])
 
                 _LOGGER.info("Successfully logged in to eWeLink")
-                self.__user_data = data.get("data", {})
+                self.__set_user_data(login_data)
                 self.set_at_updated_ts(now_timestamp())
                 return self.__user_data
 
@@ -239,6 +293,8 @@ class EWeLinkApiClient:
         except TimeoutError as err:
             _LOGGER.error("Error happen 2 %s", err)
             raise EWeLinkConnectionError("Request timeout") from err
+        except KeyError as err:
+            raise EWeLinkApiError(f"Unexpected login response, missing {err}") from err
 
     async def get_family(self):
         """Get user family data."""
@@ -248,15 +304,13 @@ class EWeLinkApiClient:
                 headers=self.__get_headers(RequestMethod.GET),
                 timeout=aiohttp.ClientTimeout(10),
             ) as response:
-                data: dict = await response.json()
+                data: dict = await response.json(loads=json_loads)
                 self.__common_error_handler(data)
-                if data["error"] == 0:
-                    family_list = deep_get(data, ["data", "familyList"], [])
-                    self.__family_list = [
-                        family
-                        for family in family_list
-                        if family.get("familyType") in [1, 2]
-                    ]
+                self.__family_list = [
+                    family
+                    for family in data["data"]["familyList"]
+                    if family.get("familyType") in [1, 2]
+                ]
                 return data
         except aiohttp.ClientError as err:
             _LOGGER.error("Get family aiohttp.ClientError happen: %s", err)
@@ -264,6 +318,8 @@ class EWeLinkApiClient:
             _LOGGER.error("Get family timeout: %s", err)
         except EWeLinkApiError as err:
             _LOGGER.error("Get family error happen: %s", err)
+        except KeyError as err:
+            _LOGGER.error("Get family unexpected response, missing %s", err)
 
     async def get_family_device(self, family_id: str):
         """Get all device by family id."""
@@ -274,20 +330,19 @@ class EWeLinkApiClient:
                 headers=self.__get_headers(RequestMethod.GET),
                 timeout=aiohttp.ClientTimeout(total=10),
             ) as response:
-                data = await response.json()
+                data = await response.json(loads=json_loads)
                 self.__common_error_handler(data)
-                if data.get("error") == 0:
-                    thing_list = deep_get(data, ["data", "thingList"], [])
-                    device_list = [
-                        item for item in thing_list if item.get("itemType") in [1, 2]
-                    ]
-                    if len(device_list) > 0:
-                        for device in device_list:
-                            device_id = deep_get(device, ["itemData", "deviceid"])
-                            self.__device_dict[device_id] = EWeLinkDevice(device)
+                for item in data["data"]["thingList"]:
+                    if item.get("itemType") not in DEVICE_ITEM_TYPES:
+                        continue
+                    device_id = deep_get(item, ("itemData", "deviceid"))
+                    if device_id:
+                        self.__device_dict[device_id] = EWeLinkDevice(item)
                 return data
         except TimeoutError as err:
             raise EWeLinkConnectionError("Request timeout") from err
+        except KeyError as err:
+            raise EWeLinkApiError(f"Unexpected device response, missing {err}") from err
 
     async def get_all_devices(self) -> dict[str, EWeLinkDevice]:
         """Get all devices from eWeLink account."""
@@ -298,14 +353,39 @@ class EWeLinkApiClient:
 
         try:
             family_ids = [family.get("id") for family in self.__family_list]
-            _LOGGER.info("Get_all_devices: family_ids: %s", json.dumps(family_ids))
-            tasks = [self.get_family_device(family_id) for family_id in family_ids]
-            await asyncio.gather(*tasks, return_exceptions=True)
+            _LOGGER.info("Get_all_devices: family_ids: %s", family_ids)
+            # Listed devices are stored as new objects, so an unchanged object
+            # after a complete poll belongs to a device removed from the account
+            previous_devices = dict(self.__device_dict)
+            failed = False
+            tasks = [
+                create_eager_task(self.get_family_device(family_id))
+                for family_id in family_ids
+            ]
+            try:
+                # Each task fills device_dict as it completes. A failed family
+                # keeps its previous devices, only an auth failure cancels the
+                # remaining family requests.
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        await next_done
+                    except (EWeLinkApiError, aiohttp.ClientError, TimeoutError) as err:
+                        failed = True
+                        _LOGGER.error("Get_all_devices: family request error: %s", err)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
         except aiohttp.ClientError as err:
             raise EWeLinkConnectionError(f"Connection error: {err}") from err
         except TimeoutError as err:
             raise EWeLinkConnectionError("Request timeout") from err
         else:
+            if not failed:
+                for device_id, device in previous_devices.items():
+                    if self.__device_dict.get(device_id) is device:
+                        del self.__device_dict[device_id]
             return self.device_dict
 
     @property
@@ -314,9 +394,9 @@ class EWeLinkApiClient:
         return self.__session
 
     @property
-    def api_key(self) -> str:
+    def api_key(self) -> str | None:
         """Get api key."""
-        return deep_get(self.__user_data, ["user", "apikey"])
+        return self.__api_key
 
     @property
     def app_id(self) -> str | None:
@@ -331,17 +411,17 @@ class EWeLinkApiClient:
     @property
     def access_token(self) -> str:
         """Get at."""
-        return deep_get(self.__user_data, ["at"])
+        return self.__access_token
 
     @property
     def refresh_token(self) -> str | None:
         """Get rt."""
-        return deep_get(self.__user_data, ["rt"])
+        return deep_get(self.__user_data, ("rt",))
 
     @property
     def api_timezone(self) -> dict | None:
         """Get the time zone returned from the api."""
-        return deep_get(self.__user_data, ["user", "timezone"])
+        return deep_get(self.__user_data, ("user", "timezone"))
 
     @property
     def account(self) -> str | None:
@@ -361,11 +441,4 @@ class EWeLinkApiClient:
     @property
     def logged(self) -> bool:
         """Get is logged."""
-        now_ts = now_timestamp()
-        has_at = isinstance(self.access_token, str) and len(self.access_token) > 0
-        is_at_expired = (
-            self.at_updated_ts + (15 * 24 * 60 * 60 * 1000) < now_ts
-            if isinstance(self.at_updated_ts, int)
-            else False
-        )
-        return has_at and (not is_at_expired)
+        return bool(self.__access_token) and now_timestamp() <= self.__at_expired_ts
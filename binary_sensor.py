@@ -7,13 +7,14 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import COORDINATOR, DOMAIN
 from .coordinator import EWeLinkDataCoordinator
 from .entity import EWeLinkEntity
-from .uiid import BINARY_SENSOR_TYPE, PLATFORM, get_uiid_instance
+from .uiid import BINARY_SENSOR_TYPE, PLATFORM
+from .utils import iter_platform_configs
 
 
 async def async_setup_entry(
@@ -23,37 +24,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up eWeLink binary sensor from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    entities: list[EWeLinkBinarySensor] = []
-
-    for device_id, device in coordinator.data.items():
-        uiid_instance = get_uiid_instance(device.uiid)
-        if (
-            uiid_instance is not None
-            and uiid_instance.platform_config is not None
-            and isinstance(uiid_instance.platform_config, list)
-            and len(uiid_instance.platform_config) > 0
-        ):
-            binary_sensor_config_list = [
-                config
-                for config in uiid_instance.platform_config
-                if config["platform"] == PLATFORM.BINARY_SENSOR
-            ]
-            for binary_sensor_config in binary_sensor_config_list:
-                ewelink_binary_sensor_entity: EWeLinkBinarySensor | None = None
-                binary_sensor_type = binary_sensor_config.get("type")
-                if binary_sensor_type == BINARY_SENSOR_TYPE.DOOR:
-                    ewelink_binary_sensor_entity = EWeLinkDoorBinarySensor(
-                        coordinator, device_id
-                    )
-                elif binary_sensor_type == BINARY_SENSOR_TYPE.HUMAN:
-                    ewelink_binary_sensor_entity = EWeLinkHumanBinarySensor(
-                        coordinator, device_id
-                    )
-
-                if ewelink_binary_sensor_entity is not None:
-                    entities.append(ewelink_binary_sensor_entity)
-
-    async_add_entities(entities, update_before_add=True)
+    entities: list[EWeLinkBinarySensor] = [
+        sensor_class(coordinator, device_id)
+        for device_id, _, config in iter_platform_configs(
+            coordinator, PLATFORM.BINARY_SENSOR
+        )
+        if (sensor_class := BINARY_SENSOR_CLASSES.get(config.get("type"))) is not None
+    ]
+    async_add_entities(entities)
 
 
 class EWeLinkBinarySensor(EWeLinkEntity, BinarySensorEntity):
@@ -70,12 +48,12 @@ class EWeLinkDoorBinarySensor(EWeLinkBinarySensor):
     def __init__(self, coordinator: EWeLinkDataCoordinator, device_id: str) -> None:
         """Init."""
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"ewelink_lot_{device_id}_door_binary_sensor"
+        self._attr_unique_id = self._build_uid("door_binary_sensor")
 
-    @property
-    def is_on(self) -> bool | None:
-        """Get door binary sensor state."""
-        return self.uiid_instance.get_door_lock_value(self.ewelink_device.device)
+    @callback
+    def _update_attrs(self) -> None:
+        """Update door binary sensor state."""
+        self._attr_is_on = self._uiid_instance.get_door_lock_value(self._device.device)
 
 
 class EWeLinkHumanBinarySensor(EWeLinkBinarySensor):
@@ -86,9 +64,17 @@ class EWeLinkHumanBinarySensor(EWeLinkBinarySensor):
     def __init__(self, coordinator: EWeLinkDataCoordinator, device_id: str) -> None:
         """Init."""
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"{DOMAIN}_{device_id}_human_binary_sensor"
+        self._attr_unique_id = self._build_uid("human_binary_sensor")
 
-    @property
-    def is_on(self) -> bool | None:
-        """Get huamn exist value."""
-        return self.uiid_instance.get_human_exsit_value(self.ewelink_device.device)
+    @callback
+    def _update_attrs(self) -> None:
+        """Update huamn exist value."""
+        self._attr_is_on = self._uiid_instance.get_human_exsit_value(
+            self._device.device
+        )
+
+
+BINARY_SENSOR_CLASSES: dict[BINARY_SENSOR_TYPE, type[EWeLinkBinarySensor]] = {
+    BINARY_SENSOR_TYPE.DOOR: EWeLinkDoorBinarySensor,
+    BINARY_SENSOR_TYPE.HUMAN: EWeLinkHumanBinarySensor,
+}
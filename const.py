@@ -9,6 +9,8 @@ from homeassistant.const import Platform
 DEV_MODE = os.getenv("HA_DEV_MODE") == "1"
 
 DOMAIN: Final = "ewelink_iot"
+# Misspelled unique id prefix used by older versions of some entities
+LEGACY_UNIQUE_ID_PREFIX: Final = "ewelink_lot"
 PLATFORMS: Final = [
     Platform.BINARY_SENSOR,
     Platform.EVENT,
@@ -36,6 +38,8 @@ APP_SECRET: Final = "V0LmoW0cd2cg38i1eIM0P5Z29GjES4PA"
 WS_CLIENT = "ws_client"
 API_CLIENT = "api_client"
 COORDINATOR = "coordinator"
+SESSION = "session"
+SESSION_CLOSE_UNSUB = "session_close_unsub"
 
 # Config entry keys
 CONF_ACCOUNT: Final = "account"
@@ -55,6 +59,9 @@ WS_MSG_ACTION_SYSMSG: Final = "sysmsg"
 WS_MSG_ACTION_USER_ONLINE: Final = "userOnline"
 WS_USER_AGENT: Final = "pc_ewelink"
 
+# Dispatcher signal for device pushed updates, formatted with the device id
+SIGNAL_DEVICE_UPDATE: Final = f"{DOMAIN}_device_update_{{}}"
+
 # re pattren
 RE_EMAIL_PATTREN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
 
@@ -293,3 +300,11 @@ EWELINK_API_MAP: Final = {
     REGION_IR: EWELINK_API_IR,
     REGION_TEST: EWELINK_API_TEST,
 }
+
+COUNTRY_CODE_TO_REGION: Final = {
+    item[CONF_COUNTRY_CODE]: item[CONF_REGION] for item in REGIONS_MAP
+}
+COUNTRY_CODE_TO_API_BASE_URL: Final = {
+    country_code: EWELINK_API_MAP[region]
+    for country_code, region in COUNTRY_CODE_TO_REGION.items()
+}
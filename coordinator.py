@@ -4,16 +4,17 @@ from __future__ import annotations
 
 from datetime import timedelta
 import logging
-import numbers
 from typing import Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import EWeLinkApiClient, EWeLinkApiError, EWeLinkDevice
-from .uiid import get_uiid_instance
-from .utils import deep_get, gen_event_callback_key, get_device_uiid, merge
+from .const import SIGNAL_DEVICE_UPDATE
+from .utils import deep_get
 from .websocket import EWeLinkWebSocketClient
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,16 +41,17 @@ class EWeLinkDataCoordinator(DataUpdateCoordinator[dict[str, EWeLinkDevice]]):
         self.api_client = api_client
         self.ws_client = ws_client
         self.data = {}
-        self.event_handler_map: dict[str, Callable] = {}
+        self.event_handler_map: dict[tuple[str, int], Callable] = {}
+        # Shared by all entities of a device, rebuilt when the entry reloads
+        self.device_info_cache: dict[str, DeviceInfo] = {}
 
-    def add_event_handler(self, key, handler):
+    def add_event_handler(self, key: tuple[str, int], handler):
         """Add event entity handler."""
         self.event_handler_map[key] = handler
 
-    def remove_event_handler(self, key):
+    def remove_event_handler(self, key: tuple[str, int]):
         """Remove event entity handler."""
-        if key in self.event_handler_map:
-            self.event_handler_map.pop(key)
+        self.event_handler_map.pop(key, None)
 
     async def _async_update_data(self) -> dict[str, EWeLinkDevice]:
         """Fetch data from API."""
@@ -76,35 +78,33 @@ class EWeLinkDataCoordinator(DataUpdateCoordinator[dict[str, EWeLinkDevice]]):
         if ewelink_device is None:
             return
 
-        uiid = get_device_uiid(ewelink_device.device)
-        if uiid is None:
+        if ewelink_device.uiid is None:
             return
 
-        uiid_instance: Any = get_uiid_instance(uiid)
+        uiid_instance: Any = ewelink_device.uiid_instance
         if (
             uiid_instance
             and hasattr(uiid_instance, "event_types")
             and isinstance(uiid_instance.event_types, list)
             and len(uiid_instance.event_types) > 0
         ):
-            outlet: int = deep_get(params, ["outlet"], 0)
-            key = deep_get(params, ["key"])
-            if isinstance(outlet, numbers.Number) and isinstance(key, numbers.Number):
-                handler_key = gen_event_callback_key(device_id, outlet)
-                event_handler = self.event_handler_map[handler_key]
+            outlet: int = deep_get(params, ("outlet",), 0)
+            key = deep_get(params, ("key",))
+            if isinstance(outlet, (int, float)) and isinstance(key, (int, float)):
+                event_handler = self.event_handler_map.get((device_id, outlet))
                 if event_handler is not None:
                     event_handler(outlet, key)
 
-        merge(ewelink_device.device, {"itemData": {"params": params}})
-        self.async_set_updated_data(self.data)
+        ewelink_device.update_params(params)
+        async_dispatcher_send(self.hass, SIGNAL_DEVICE_UPDATE.format(device_id))
 
     def update_entity_available(self, device_id, online):
         """Update entity available."""
         ewelink_device = self.data.get(device_id)
         if ewelink_device is None:
             return
-        merge(ewelink_device.device, {"itemData": {"online": bool(online)}})
-        self.async_set_updated_data(self.data)
+        ewelink_device.set_online(bool(online))
+        async_dispatcher_send(self.hass, SIGNAL_DEVICE_UPDATE.format(device_id))
 
     async def control_device(self, ewelink_device: EWeLinkDevice, params: dict):
         """Control EWeLink device."""
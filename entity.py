@@ -4,19 +4,21 @@ from __future__ import annotations
 
 from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .api import EWeLinkDevice
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_DEVICE_UPDATE
 from .coordinator import EWeLinkDataCoordinator
-from .uiid import get_uiid_instance
-from .utils import get_device_uiid
 
 
 class EWeLinkEntity(CoordinatorEntity[EWeLinkDataCoordinator]):
     """Base entity for eWeLink devices."""
 
+    __slots__ = ("_device", "_uiid_instance", "device_id", "uiid")
+
     _attr_has_entity_name = True
 
     def __init__(
@@ -27,28 +29,61 @@ class EWeLinkEntity(CoordinatorEntity[EWeLinkDataCoordinator]):
         """Initialize the entity."""
         super().__init__(coordinator)
         device: EWeLinkDevice = coordinator.data[device_id]
-        uiid = get_device_uiid(device.device)
         self.device_id = device_id
-        self.uiid = uiid
-        self.uiid_instance: Any = get_uiid_instance(uiid)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, device_id)},
-            name=device.device_name,
-            manufacturer=device.brand_name,
-            model=device.model,
-            serial_number=device_id,
+        self.uiid = device.uiid
+        self._device: EWeLinkDevice | None = device
+        self._uiid_instance: Any = device.uiid_instance
+        device_info = coordinator.device_info_cache.get(device_id)
+        if device_info is None:
+            device_info = coordinator.device_info_cache[device_id] = DeviceInfo(
+                identifiers={(DOMAIN, device_id)},
+                name=device.device_name,
+                manufacturer=device.brand_name,
+                model=device.model,
+                serial_number=device_id,
+            )
+        self._attr_device_info = device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Register for device state pushes when added to hass."""
+        await super().async_added_to_hass()
+        if self._device is not None:
+            self._update_attrs()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_DEVICE_UPDATE.format(self.device_id),
+                self._async_handle_device_update,
+            )
         )
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        if not super().available:
-            return False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the device reference when the coordinator updates."""
+        self._device = self.coordinator.data.get(self.device_id)
+        if self._device is not None:
+            self._update_attrs()
+        super()._handle_coordinator_update()
 
-        device = self.coordinator.data.get(self.device_id)
-        return device is not None and device.online
+    @callback
+    def _async_handle_device_update(self) -> None:
+        """Handle device update pushed from websocket."""
+        # A running poll may have replaced the device object already
+        self._device = self.coordinator.data.get(self.device_id)
+        if self._device is not None:
+            self._update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update entity state attributes from the device params."""
+
+    def _build_uid(self, suffix: str) -> str:
+        """Build entity unique id."""
+        return f"{DOMAIN}_{self.device_id}_{suffix}"
 
     @property
-    def ewelink_device(self) -> EWeLinkDevice:
-        """Get EWeLinkDevice instance."""
-        return self.coordinator.data.get(self.device_id)  # type: ignore  # noqa: PGH003
+    def available(self) -> bool:
+        """Return if entity is available."""
+        device = self._device
+        return super().available and device is not None and device.online
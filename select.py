@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from functools import cached_property
+
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import COORDINATOR, DOMAIN
 from .coordinator import EWeLinkDataCoordinator
 from .entity import EWeLinkEntity
-from .uiid import PLATFORM, SELECT_TYPE, get_uiid_instance
+from .uiid import PLATFORM, SELECT_TYPE
+from .utils import iter_platform_configs
 
 
 async def async_setup_entry(
@@ -20,78 +23,63 @@ async def async_setup_entry(
 ) -> None:
     """Set up eWeLink switches from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    entities: list[EWeLinkSelectEntity] = []
-
-    for device_id, device in coordinator.data.items():
-        uiid_instance = get_uiid_instance(device.uiid)
-        if (
-            uiid_instance is not None
-            and uiid_instance.platform_config is not None
-            and isinstance(uiid_instance.platform_config, list)
-            and len(uiid_instance.platform_config) > 0
-        ):
-            select_config_list = [
-                config
-                for config in uiid_instance.platform_config
-                if config["platform"] == PLATFORM.SELECT
-            ]
-            for select_config in select_config_list:
-                entity: EWeLinkSelectEntity | None = None
-                select_type = select_config.get("type")
-                if select_type == SELECT_TYPE.STARTUP:
-                    entity = EWeLinkStartupEntity(
-                        coordinator, device_id, select_config.get("config", {})
-                    )
-                if entity is not None:
-                    entities.append(entity)
-
-    async_add_entities(entities, update_before_add=True)
+    entities: list[EWeLinkSelectEntity] = [
+        select_class(coordinator, device_id, select_config.get("config", {}))
+        for device_id, _, select_config in iter_platform_configs(
+            coordinator, PLATFORM.SELECT
+        )
+        if (select_class := SELECT_CLASSES.get(select_config.get("type"))) is not None
+    ]
+    async_add_entities(entities)
 
 
 class EWeLinkSelectEntity(EWeLinkEntity, SelectEntity):
     """Representation of an select options."""
 
+    __slots__ = ("config",)
+
     def __init__(
         self, coordinator: EWeLinkDataCoordinator, device_id: str, config=None
     ) -> None:
         """Initialize the switch."""
         super().__init__(coordinator, device_id)
         self.config = config
-        self._attr_unique_id = f"ewelink_lot_{device_id}_select"
+        self._attr_unique_id = self._build_uid("select")
         self._attr_name = None  # Use device name
 
 
 class EWeLinkStartupEntity(EWeLinkSelectEntity):
     """Startup select entity."""
 
-    @property
+    @cached_property
     def outlet(self):
         """Outlet."""
         if self.config:
             return self.config.get("outlet")
         return None
 
-    @property
-    def current_option(self) -> str | None:
-        """Return current state."""
-        if not self.ewelink_device or not self.uiid_instance:
-            return None
-        return self.uiid_instance.get_startup_value(
-            self.ewelink_device.device, self.outlet
+    @callback
+    def _update_attrs(self) -> None:
+        """Update current startup option."""
+        self._attr_current_option = self._uiid_instance.get_startup_value(
+            self._device.device, self.outlet
         )
 
-    @property
+    @cached_property
     def options(self) -> list[str]:
         """Startup options."""
         if self.config and "options" in self.config:
-            return self.config.get("options")
+            return list(self.config["options"])
         return []
 
     async def async_select_option(self, option: str) -> None:
         """Select startup."""
-        if not self.ewelink_device:
+        if not self._device:
             return
-        params = self.uiid_instance.gen_control_startup_params(option, self.outlet)
-        result = await self.coordinator.control_device(self.ewelink_device, params)
-        if result and result.get("error") == 0:
-            self._async_write_ha_state()
+        params = self._uiid_instance.gen_control_startup_params(option, self.outlet)
+        await self.coordinator.control_device(self._device, params)
+
+
+SELECT_CLASSES: dict[SELECT_TYPE, type[EWeLinkSelectEntity]] = {
+    SELECT_TYPE.STARTUP: EWeLinkStartupEntity,
+}
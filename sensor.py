@@ -14,13 +14,14 @@ from homeassistant.const import (
     EntityCategory,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import COORDINATOR, DOMAIN
 from .coordinator import EWeLinkDataCoordinator
 from .entity import EWeLinkEntity
-from .uiid import PLATFORM, SENSOR_TYPE, get_uiid_instance
+from .uiid import PLATFORM, SENSOR_TYPE
+from .utils import iter_platform_configs
 
 
 async def async_setup_entry(
@@ -30,40 +31,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up eWeLink sensor from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
-    entities: list[EWeLinkSensor] = []
-
-    for device_id, device in coordinator.data.items():
-        uiid_instance = get_uiid_instance(device.uiid)
-        if (
-            uiid_instance is not None
-            and uiid_instance.platform_config is not None
-            and isinstance(uiid_instance.platform_config, list)
-            and len(uiid_instance.platform_config) > 0
-        ):
-            sensor_config_list = [
-                config
-                for config in uiid_instance.platform_config
-                if config["platform"] == PLATFORM.SENSOR
-            ]
-            for sensor_config in sensor_config_list:
-                ewelink_sensor_entity: EWeLinkSensor | None = None
-                sensor_type = sensor_config.get("type")
-                if sensor_type == SENSOR_TYPE.RSSI:
-                    ewelink_sensor_entity = EWeLinkRssiSensor(coordinator, device_id)
-                elif sensor_type == SENSOR_TYPE.TEMPERATURE:
-                    ewelink_sensor_entity = EWeLinkTemperatureSensor(
-                        coordinator, device_id
-                    )
-                elif sensor_type == SENSOR_TYPE.HUMIDITY:
-                    ewelink_sensor_entity = EWeLinkHumiditySensor(
-                        coordinator, device_id
-                    )
-                elif sensor_type == SENSOR_TYPE.BATTERY:
-                    ewelink_sensor_entity = EWeLinkBatterySensor(coordinator, device_id)
-                if ewelink_sensor_entity:
-                    entities.append(ewelink_sensor_entity)
-
-    async_add_entities(entities, update_before_add=True)
+    entities: list[EWeLinkSensor] = [
+        sensor_class(coordinator, device_id)
+        for device_id, _, sensor_config in iter_platform_configs(
+            coordinator, PLATFORM.SENSOR
+        )
+        if (sensor_class := SENSOR_CLASSES.get(sensor_config.get("type"))) is not None
+    ]
+    async_add_entities(entities)
 
 
 class EWeLinkSensor(EWeLinkEntity, SensorEntity):
@@ -87,12 +62,14 @@ class EWeLinkRssiSensor(EWeLinkSensor):
     def __init__(self, coordinator: EWeLinkDataCoordinator, device_id: str) -> None:
         """Init."""
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"ewelink_lot_{device_id}_rssi_sensor"
+        self._attr_unique_id = self._build_uid("rssi_sensor")
 
-    @property
-    def native_value(self):
-        """Rssi value."""
-        return self.uiid_instance.get_rssi_value(self.ewelink_device.device)
+    @callback
+    def _update_attrs(self) -> None:
+        """Update rssi value."""
+        self._attr_native_value = self._uiid_instance.get_rssi_value(
+            self._device.device
+        )
 
 
 class EWeLinkTemperatureSensor(EWeLinkSensor):
@@ -103,17 +80,19 @@ class EWeLinkTemperatureSensor(EWeLinkSensor):
     def __init__(self, coordinator: EWeLinkDataCoordinator, device_id: str) -> None:
         """Init."""
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"ewelink_lot_{device_id}_temperature_sensor"
+        self._attr_unique_id = self._build_uid("temperature_sensor")
 
     @property
     def native_unit_of_measurement(self) -> str:
         """Temperature unit."""
         return UnitOfTemperature.CELSIUS
 
-    @property
-    def native_value(self):
-        """Temperature value."""
-        return self.uiid_instance.get_temperature_value(self.ewelink_device.device)
+    @callback
+    def _update_attrs(self) -> None:
+        """Update temperature value."""
+        self._attr_native_value = self._uiid_instance.get_temperature_value(
+            self._device.device
+        )
 
 
 class EWeLinkHumiditySensor(EWeLinkSensor):
@@ -125,12 +104,14 @@ class EWeLinkHumiditySensor(EWeLinkSensor):
     def __init__(self, coordinator: EWeLinkDataCoordinator, device_id: str) -> None:
         """Init."""
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"ewelink_lot_{device_id}_humidity_sensor"
+        self._attr_unique_id = self._build_uid("humidity_sensor")
 
-    @property
-    def native_value(self):
-        """Humidity value."""
-        return self.uiid_instance.get_humidity_value(self.ewelink_device.device)
+    @callback
+    def _update_attrs(self) -> None:
+        """Update humidity value."""
+        self._attr_native_value = self._uiid_instance.get_humidity_value(
+            self._device.device
+        )
 
 
 class EWeLinkBatterySensor(EWeLinkSensor):
@@ -143,9 +124,19 @@ class EWeLinkBatterySensor(EWeLinkSensor):
     def __init__(self, coordinator: EWeLinkDataCoordinator, device_id: str) -> None:
         """Init."""
         super().__init__(coordinator, device_id)
-        self._attr_unique_id = f"ewelink_lot_{device_id}_battery_sensor"
-
-    @property
-    def native_value(self) -> int | None:
-        """Battery value."""
-        return self.uiid_instance.get_battery_value(self.ewelink_device.device)
+        self._attr_unique_id = self._build_uid("battery_sensor")
+
+    @callback
+    def _update_attrs(self) -> None:
+        """Update battery value."""
+        self._attr_native_value = self._uiid_instance.get_battery_value(
+            self._device.device
+        )
+
+
+SENSOR_CLASSES: dict[SENSOR_TYPE, type[EWeLinkSensor]] = {
+    SENSOR_TYPE.RSSI: EWeLinkRssiSensor,
+    SENSOR_TYPE.TEMPERATURE: EWeLinkTemperatureSensor,
+    SENSOR_TYPE.HUMIDITY: EWeLinkHumiditySensor,
+    SENSOR_TYPE.BATTERY: EWeLinkBatterySensor,
+}
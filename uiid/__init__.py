@@ -30,18 +30,19 @@ uiid_dict = {
     7014: Uiid7014,
     7016: Uiid7016,
 }
-uiid_instance_dict = {}
-
-
-def get_uiid_instance(uiid):
-    """Get device coordinator."""
-    stored = uiid_instance_dict.get(uiid)
-    if stored is not None:
-        return stored
-    UiidClass = uiid_dict.get(uiid)
-    uiid_instance = UiidClass(uiid) if UiidClass is not None else Uiid(uiid)
-    uiid_instance_dict[uiid] = uiid_instance
-    return uiid_instance
+
+
+class _UiidCache(dict):
+    """Uiid instances keyed by uiid, created on first lookup."""
+
+    def __missing__(self, uiid):
+        uiid_instance = uiid_dict.get(uiid, Uiid)(uiid)
+        self[uiid] = uiid_instance
+        return uiid_instance
+
+
+uiid_instance_dict = _UiidCache()
+get_uiid_instance = uiid_instance_dict.__getitem__
 
 
 __all__ = [
@@ -1,6 +1,8 @@
 """Base uiid coordinator class."""
 
+from collections.abc import Mapping, Sequence
 from enum import StrEnum
+from functools import cached_property
 import numbers
 from typing import Any
 
@@ -8,14 +10,12 @@ from homeassistant.components.light import DEFAULT_MAX_KELVIN, DEFAULT_MIN_KELVI
 
 from ..utils import deep_get
 
-SINGLE_PROTOCOL_UIIDS = [1]
-MULTIPLE_SINGLE_PROTOCOL_UIIDS = [191]
-MULTIPLE_UIIDS = []
-SWITCH_UIIDS = [
-    *SINGLE_PROTOCOL_UIIDS,
-    *MULTIPLE_SINGLE_PROTOCOL_UIIDS,
-    *MULTIPLE_UIIDS,
-]
+_EMPTY: dict = {}
+
+SINGLE_PROTOCOL_UIIDS = frozenset({1})
+MULTIPLE_SINGLE_PROTOCOL_UIIDS = frozenset({191})
+MULTIPLE_UIIDS: frozenset[int] = frozenset()
+SWITCH_UIIDS = SINGLE_PROTOCOL_UIIDS | MULTIPLE_SINGLE_PROTOCOL_UIIDS | MULTIPLE_UIIDS
 
 
 class SELECT_TYPE(StrEnum):
@@ -80,23 +80,48 @@ class STARTUP_OPTONS(StrEnum):
     STAY = "stay"
 
 
+def device_params(device: dict) -> dict:
+    """Get the params dict of a device, or an empty dict."""
+    return (device.get("itemData") or _EMPTY).get("params") or _EMPTY
+
+
 class Uiid:
     """EWeLink Switch Coordinator."""
 
+    # Entity configs of the uiid, overridden by subclasses
+    platform_config: tuple[Mapping[str, Any], ...] = ()
+
     def __init__(self, uiid) -> None:
         """Init."""
         self.uiid = uiid
+        self._is_single = uiid in SINGLE_PROTOCOL_UIIDS
+        self._is_multi_single = uiid in MULTIPLE_SINGLE_PROTOCOL_UIIDS
+        self._is_multi = uiid in MULTIPLE_UIIDS
+        if self._is_multi_single:
+            self._switches_off = [
+                {"switch": SWITCH_STATE.OFF, "outlet": i} for i in range(4)
+            ]
 
     def get_params(
         self, device: dict, keys: list[str | int], defaultValue: Any = None
     ) -> Any | None:
         """Get value from device params."""
-        return deep_get(device, ["itemData", "params", *keys], defaultValue)
-
-    @property
-    def platform_config(self):
-        """Platform placeholder."""
-        return []
+        return deep_get(device, ("itemData", "params", *keys), defaultValue)
+
+    @cached_property
+    def platform_config_by_platform(self) -> dict[PLATFORM, list[Mapping[str, Any]]]:
+        """Platform config grouped by platform."""
+        config_by_platform: dict[PLATFORM, list[Mapping[str, Any]]] = {}
+        platform_config = self.platform_config
+        if not isinstance(platform_config, (list, tuple)):
+            return config_by_platform
+        for config in platform_config:
+            config_by_platform.setdefault(config["platform"], []).append(config)
+        return config_by_platform
+
+    def configs_for(self, platform: PLATFORM) -> Sequence[Mapping[str, Any]]:
+        """Get platform configs of the given platform."""
+        return self.platform_config_by_platform.get(platform, ())
 
     @property
     def min_color_temp_kelvin(self) -> int:
@@ -115,88 +140,78 @@ class Uiid:
 
     def get_switch_value(self, device: dict) -> bool:
         """Get ewelink switch device switch state."""
-        if self.uiid in MULTIPLE_SINGLE_PROTOCOL_UIIDS:
-            return (
-                deep_get(
-                    device,
-                    ["itemData", "params", "switches", 0, "switch"],
-                    SWITCH_STATE.OFF,
-                )
-                == SWITCH_STATE.ON
-            )
-
-        return (
-            deep_get(device, ["itemData", "params", "switch"], SWITCH_STATE.OFF)
-            == SWITCH_STATE.ON
-        )
+        params = device_params(device)
+        if self._is_multi_single:
+            try:
+                return params["switches"][0]["switch"] == SWITCH_STATE.ON
+            except (KeyError, IndexError, TypeError):
+                return False
+
+        return params.get("switch") == SWITCH_STATE.ON
 
     def gen_control_switch_params(self, is_on: bool):
         "Gen control switch params."
         target = SWITCH_STATE.ON if is_on else SWITCH_STATE.OFF
-        if self.uiid in MULTIPLE_SINGLE_PROTOCOL_UIIDS:
-            return {
-                "switches": [
-                    {"switch": target if i == 0 else SWITCH_STATE.OFF, "outlet": i}
-                    for i in range(4)
-                ]
-            }
+        if self._is_multi_single:
+            # Copied, the params are merged into the device state after sending
+            switches = [switch.copy() for switch in self._switches_off]
+            switches[0]["switch"] = target
+            return {"switches": switches}
         return {"switch": target}
 
     def get_startup_value(self, device: dict, outlet: int | None = None) -> str | None:
         """Get device startup state."""
-        if not self.uiid:
-            return None
-        if self.uiid in SINGLE_PROTOCOL_UIIDS:
+        if self._is_single:
             return self.get_params(device, ["startup"])
-        if self.uiid in MULTIPLE_SINGLE_PROTOCOL_UIIDS:
+        if self._is_multi_single:
             return self.get_params(device, ["configure", 0, "startup"])
-        if self.uiid in MULTIPLE_UIIDS and outlet:
+        if self._is_multi and outlet:
             return self.get_params(device, ["configure", outlet, "startup"])
         return None
 
     def gen_control_startup_params(self, startup: str, outlet: int | None = None):
         """Gen control startup params."""
-        if not self.uiid:
-            return None
-        if self.uiid in SINGLE_PROTOCOL_UIIDS:
+        if self._is_single:
             return {"startup": startup}
-        if self.uiid in MULTIPLE_SINGLE_PROTOCOL_UIIDS:
+        if self._is_multi_single:
             return {"configure": [{"outlet": 0, "startup": startup}]}
-        if self.uiid in MULTIPLE_UIIDS and outlet is not None:
+        if self._is_multi and outlet is not None:
             return {"configure": [{"outlet": outlet, "startup": startup}]}
         return None
 
     def get_rssi_value(self, device: dict) -> int | None:
         """Get Rssi value."""
-        return deep_get(device, ["itemData", "params", "rssi"], None)
+        return device_params(device).get("rssi")
 
     def get_temperature_value(self, device: dict) -> int | float | None:
         """Get temperature value."""
-        str_value = deep_get(device, ["itemData", "params", "temperature"], None)
+        str_value = device_params(device).get("temperature")
         if str_value is not None:
             return round(float(str_value) / 100, 1)
         return None
 
     def get_humidity_value(self, device: dict) -> int | float | None:
         """Get humidity value."""
-        str_value = deep_get(device, ["itemData", "params", "humidity"], None)
+        str_value = device_params(device).get("humidity")
         if str_value is not None:
             return round(float(str_value) / 100, 1)
         return None
 
     def get_battery_value(self, device: dict) -> int | float | None:
         """Get battery value."""
-        value = deep_get(device, ["itemData", "params", "battery"], None)
+        value = device_params(device).get("battery")
+        if value is None:
+            return None
         if isinstance(value, numbers.Number):
             return round(value)  # pyright: ignore[reportArgumentType]
         return round(int(value))
 
     def get_door_lock_value(self, device: dict) -> bool | None:
         """Get door sensor lock value."""
-        value = deep_get(device, ["itemData", "params", "lock"], None)
+        value = device_params(device).get("lock")
         return bool(value)
 
     def get_human_exsit_value(self, device: dict) -> bool | None:
         """Get human sensor exist value."""
-        value = deep_get(device, ["itemData", "params", "human"], None)
+        value = device_params(device).get("human")
         return bool(value)
@@ -1,26 +1,54 @@
 """Uiid 104: single switch device."""
 
 import numbers
+from types import MappingProxyType
 
 from homeassistant.components.light import ColorMode
 
-from .uiid import PLATFORM, Uiid
-from .utils import deep_get, map_value_general
+from .uiid import PLATFORM, Uiid, device_params
+
+# Light ltype to HA color mode, other ltypes are white light
+LTYPE_TO_COLOR_MODE = {"color": ColorMode.RGB}
+
+
+def _linear_map(input_range, target_range) -> tuple[float, float]:
+    """Slope and offset mapping input_range linearly onto target_range."""
+    r_min, r_max = input_range
+    t_min, t_max = target_range
+    slope = (t_max - t_min) / (r_max - r_min)
+    return slope, t_min - r_min * slope
+
+
+def _check_range(value, low, high) -> None:
+    """Raise ValueError when value is outside low - high."""
+    if value < low or value > high:
+        raise ValueError(f"value must in {low} - {high}. got {value}")
 
 
 class Uiid104(Uiid):
     """Uiid 104."""
 
+    platform_config = (MappingProxyType({"platform": PLATFORM.LIGHT}),)
+
     def __init__(self, *args, **kwargs) -> None:
         """Init."""
         super().__init__(uiid=104)
         self.ewelink_color_temp_range = [0, 255]
         self.ewelink_brightness_range = [1, 100]
-
-    @property
-    def platform_config(self) -> list:
-        """Platform config."""
-        return [{"platform": PLATFORM.LIGHT}]
+        # The ranges are fixed, so the conversions reduce to slope and offset
+        kelvin_range = [self.min_color_temp_kelvin, self.max_color_temp_kelvin]
+        self._br_e2h_slope, self._br_e2h_offset = _linear_map(
+            self.ewelink_brightness_range, self.ha_brightness_range
+        )
+        self._br_h2e_slope, self._br_h2e_offset = _linear_map(
+            self.ha_brightness_range, self.ewelink_brightness_range
+        )
+        self._ct_e2h_slope, self._ct_e2h_offset = _linear_map(
+            self.ewelink_color_temp_range, kelvin_range
+        )
+        self._ct_h2e_slope, self._ct_h2e_offset = _linear_map(
+            kelvin_range, self.ewelink_color_temp_range
+        )
 
     @property
     def supported_color_modes(self) -> set[ColorMode]:
@@ -29,36 +57,26 @@ class Uiid104(Uiid):
 
     def get_ltype(self, device: dict) -> str:
         """Get light ltype."""
-        return deep_get(device, ["itemData", "params", "ltype"], "white")
+        return device_params(device).get("ltype", "white")
 
     def get_color_mode(self, device: dict):
         """Return HA ColorMode type."""
-        ltype = self.get_ltype(device)
-        match ltype:
-            case "color":
-                return ColorMode.RGB
-            case _:
-                return ColorMode.COLOR_TEMP
+        return LTYPE_TO_COLOR_MODE.get(self.get_ltype(device), ColorMode.COLOR_TEMP)
 
     def get_brightess(self, device: dict) -> int | None:
         """Get light brightess."""
-        try:
-            ltype = self.get_ltype(device)
-            br: int = deep_get(device, ["itemData", "params", ltype, "br"])
-            if isinstance(br, numbers.Number):
-                return round(
-                    map_value_general(
-                        br, self.ewelink_brightness_range, self.ha_brightness_range
-                    )
-                )
-        except ValueError:
-            return None
-        else:
-            return None
+        params = device_params(device)
+        light = params.get(params.get("ltype", "white"))
+        br = light.get("br") if isinstance(light, dict) else None
+        # out of range values are ignored
+        br_min, br_max = self.ewelink_brightness_range
+        if isinstance(br, numbers.Number) and br_min <= br <= br_max:
+            return round(br * self._br_e2h_slope + self._br_e2h_offset)
+        return None
 
     def get_color_rgb(self, device: dict) -> tuple | None:
         """Return light color rgb tuple."""
-        color = deep_get(device, ["itemData", "params", "color"], {})
+        color = device_params(device).get("color")
         if isinstance(color, dict):
             r: int | None = color.get("r")
             g: int | None = color.get("g")
@@ -69,60 +87,52 @@ class Uiid104(Uiid):
 
     def get_color_temp_kelvin(self, device: dict) -> int | None:
         """Get color temp kelvin."""
-        try:
-            ltype = self.get_ltype(device)
-            ct: int = deep_get(
-                device, ["itemData", "params", ltype, "ct"]
-            )  # range: 0-255
-            if isinstance(ct, numbers.Number):
-                return round(
-                    map_value_general(
-                        ct,
-                        self.ewelink_color_temp_range,
-                        [self.min_color_temp_kelvin, self.max_color_temp_kelvin],
-                    )
-                )
-        except ValueError:
-            return None
-        else:
-            return None
+        params = device_params(device)
+        light = params.get(params.get("ltype", "white"))
+        ct = light.get("ct") if isinstance(light, dict) else None
+        # out of range values are ignored
+        ct_min, ct_max = self.ewelink_color_temp_range
+        if isinstance(ct, numbers.Number) and ct_min <= ct <= ct_max:
+            return round(ct * self._ct_e2h_slope + self._ct_e2h_offset)
+        return None
 
     def gen_control_color_temp_params(self, device: dict, color_temp_kelvin: int):
         """Gen control color temp params."""
-        br = deep_get(device, ["itemData", "params", "white", "br"], 50)
-        ct = map_value_general(
-            color_temp_kelvin,
-            [self.min_color_temp_kelvin, self.max_color_temp_kelvin],
-            self.ewelink_color_temp_range,
+        white = device_params(device).get("white")
+        br = white.get("br", 50) if isinstance(white, dict) else 50
+        _check_range(
+            color_temp_kelvin, self.min_color_temp_kelvin, self.max_color_temp_kelvin
         )
-        return {"ltype": "white", "white": {"br": br, "ct": round(ct)}}
+        ct = round(color_temp_kelvin * self._ct_h2e_slope + self._ct_h2e_offset)
+        return {"ltype": "white", "white": {"br": br, "ct": ct}}
 
     def gen_control_color_rgb_params(self, device: dict, color_rgb: tuple):
         """Gen control color rgb params."""
-        br = deep_get(device, ["itemData", "params", "color", "br"], 50)
+        color = device_params(device).get("color")
+        br = color.get("br", 50) if isinstance(color, dict) else 50
         r, g, b = color_rgb
         return {"ltype": "color", "color": {"r": r, "g": g, "b": b, "br": br}}
 
     def gen_control_brightness_params(self, device: dict, brightness: int):
         """Gen control brightness params."""
-        ltype = self.get_ltype(device)
+        ewelink_params = device_params(device)
+        ltype = ewelink_params.get("ltype", "white")
         params: dict = {"ltype": ltype}
-        ewelinl_br = round(
-            map_value_general(
-                brightness, self.ha_brightness_range, self.ewelink_brightness_range
-            )
-        )
+        _check_range(brightness, *self.ha_brightness_range)
+        ewelinl_br = round(brightness * self._br_h2e_slope + self._br_h2e_offset)
+        light = ewelink_params.get("color" if ltype == "color" else "white")
+        if not isinstance(light, dict):
+            light = {}
         if ltype == "color":
-            ewelink_color = deep_get(device, ["itemData", "params", "color"], {})
             params["color"] = {
                 "br": ewelinl_br,
-                "r": ewelink_color.get("r", 100),
-                "g": ewelink_color.get("g", 100),
-                "b": ewelink_color.get("b", 100),
+                "r": light.get("r", 100),
+                "g": light.get("g", 100),
+                "b": light.get("b", 100),
             }
         else:
             params["white"] = {
                 "br": ewelinl_br,
-                "ct": deep_get(device, ["itemData", "params", "white", "ct"], 100),
+                "ct": light.get("ct", 100),
             }
         return params
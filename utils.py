@@ -1,26 +1,41 @@
 """Common utils."""
 
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
 import random
 import re
 import string
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .const import RE_EMAIL_PATTREN
 
+if TYPE_CHECKING:
+    from .coordinator import EWeLinkDataCoordinator
+    from .uiid import PLATFORM
+
+EMAIL_RE = re.compile(RE_EMAIL_PATTREN)
+
+_MISSING = object()
+
+_DEFAULT_CHARSETS = string.digits + string.ascii_lowercase + string.ascii_uppercase
+
 
 def is_valid_email(input: str) -> bool:
     """Valid input is email format."""
-    return bool(re.fullmatch(RE_EMAIL_PATTREN, input))
+    # Phone numbers never contain "@", skip the regex for them
+    return "@" in input and EMAIL_RE.fullmatch(input) is not None
 
 
 def gen_random_str(length=8, charsets: list | None = None) -> str:
     """Randomly generate a string of several characters, which defaults to numbers and lowercase letters and uppercase letters."""
     if length < 0:
         return ""
-    default_charsets = string.digits + string.ascii_lowercase + string.ascii_uppercase
-    _charsets = charsets if charsets is list and len(charsets) > 0 else default_charsets
-    return "".join(random.choice(_charsets) for _ in range(length))
+    _charsets = (
+        charsets if isinstance(charsets, list) and charsets else _DEFAULT_CHARSETS
+    )
+    return "".join(random.choices(_charsets, k=length))
 
 
 def gen_config_flow_id(account: str) -> str:
@@ -28,11 +43,17 @@ def gen_config_flow_id(account: str) -> str:
     return f"ewelink_lot_{account}"
 
 
-def deep_get(obj: object, path: list[str | int], default=None) -> Any:
+def deep_get(obj: object, path: Sequence[str | int], default=None) -> Any:
     """Deeply get a value from nested structures (dict, list, tuple, object)."""
     current = obj
     key: Any = None
     for key in path:
+        # eWeLink payloads are plain nested dicts, skip the generic lookup
+        if type(current) is dict:
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return default
+            continue
         try:
             if isinstance(current, (dict, list, tuple)):
                 current = current[key]
@@ -44,30 +65,38 @@ def deep_get(obj: object, path: list[str | int], default=None) -> Any:
     return current
 
 
-def now_timestamp():
-    """Get current timestamp."""
-    return int(round(time.time() * 1000))
+def now_timestamp() -> int:
+    """Get current timestamp in milliseconds."""
+    return time.time_ns() // 1_000_000
 
 
 def get_device_uiid(device: dict) -> int:
     """Get device uiid."""
-    return deep_get(device, ["itemData", "extra", "uiid"], None)
+    return deep_get(device, ("itemData", "extra", "uiid"), None)
 
 
 def merge(origin_dict: dict[Any, Any], source_dict: dict[Any, Any]) -> dict[Any, Any]:
     """Merge source dict to origin dict."""
-    for key, value in source_dict.items():
-        if key in origin_dict:
-            if isinstance(origin_dict[key], dict) and isinstance(value, dict):
-                merge(origin_dict[key], value)
+    stack = [(origin_dict, source_dict)]
+    while stack:
+        origin, source = stack.pop()
+        if origin is source:
+            continue
+        for key, value in source.items():
+            origin_value = origin.get(key, _MISSING)
+            if isinstance(origin_value, dict) and isinstance(value, dict):
+                stack.append((origin_value, value))
             else:
-                origin_dict[key] = value
-        else:
-            origin_dict[key] = value
+                origin[key] = value
 
     return origin_dict
 
 
-def gen_event_callback_key(device_id: str, outlet: int, component="event"):
-    """Gen event callback key."""
-    return f"{component}_{device_id}_{outlet}"
+def iter_platform_configs(
+    coordinator: EWeLinkDataCoordinator, platform: PLATFORM
+) -> Iterator[tuple[str, Any, Mapping[str, Any]]]:
+    """Yield (device_id, uiid_instance, config) for every device config of platform."""
+    for device_id, device in coordinator.data.items():
+        uiid_instance = device.uiid_instance
+        for config in uiid_instance.configs_for(platform):
+            yield device_id, uiid_instance, config
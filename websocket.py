@@ -3,23 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
+from weakref import WeakValueDictionary
 
 import aiohttp
+import orjson
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util.json import json_loads
 
 from .api import EWeLinkApiError, EWeLinkDevice
 from .const import (
     CC,
     CN,
-    CONF_COUNTRY_CODE,
-    CONF_REGION,
+    COUNTRY_CODE_TO_REGION,
     EWELINK_WS_RESOURCE_CN,
     REGION_CN,
-    REGIONS_MAP,
     WS_MSG_ACTION,
     WS_MSG_ACTION_SYSMSG,
     WS_MSG_ACTION_UPDATE,
@@ -30,6 +31,19 @@ from .utils import gen_random_str, now_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
+# Every frame handled by the client contains one of these substrings
+_HANDLED_FRAME_MARKERS = (
+    '"sequence"',
+    f'"{WS_MSG_ACTION_UPDATE}"',
+    f'"{WS_MSG_ACTION_SYSMSG}"',
+)
+
+
+def _expire_future(future: asyncio.Future) -> None:
+    """Fail the future if it is still waiting for a response."""
+    if not future.done():
+        future.set_exception(TimeoutError())
+
 
 class EWeLinkWebSocketClient:
     """eWeLink IoT WebSocket client for real-time updates."""
@@ -57,20 +71,18 @@ class EWeLinkWebSocketClient:
         self.__hass_task = None
         self.__stop_event = asyncio.Event()
         self.__coordinator_handler = {}
-        self.__pending_responses: dict[str, asyncio.Future] = {}
+        # Entries live as long as control_device holds their future
+        self.__pending_responses: WeakValueDictionary[str, asyncio.Future] = (
+            WeakValueDictionary()
+        )
 
     def __get_ws_base_url(self):
         """Get ws base url."""
-        match_region = [
-            x[CONF_REGION]
-            for x in REGIONS_MAP
-            if x[CONF_COUNTRY_CODE] == self.__country_code
-        ]
-        if len(match_region) > 0:
-            region = match_region[0]
-            top_domain = CN if region == REGION_CN else CC
-            return f"https://{region}-dispa.coolkit.{top_domain}"
-        return EWELINK_WS_RESOURCE_CN
+        region = COUNTRY_CODE_TO_REGION.get(self.__country_code)
+        if region is None:
+            return EWELINK_WS_RESOURCE_CN
+        top_domain = CN if region == REGION_CN else CC
+        return f"https://{region}-dispa.coolkit.{top_domain}"
 
     async def __get_ws_address(self):
         """Get ws connect address."""
@@ -78,21 +90,22 @@ class EWeLinkWebSocketClient:
         async with self.__session.get(
             url=server_url, timeout=aiohttp.ClientTimeout(total=10)
         ) as response:
-            data = await response.json()
+            data = await response.json(loads=json_loads)
             error = data.get("error")
             if error != 0:
                 raise EWeLinkApiError("Can not get ws connect address")
             return f"wss://{data.get('domain')}/api/ws"
 
     def __handle_ws_message(self, ws_message):
+        if not any(marker in ws_message for marker in _HANDLED_FRAME_MARKERS):
+            return
         try:
-            ws_message_json: dict = json.loads(ws_message)
+            ws_message_json: dict = orjson.loads(ws_message)
 
             sequence = str(ws_message_json.get("sequence"))
-            if sequence and sequence in self.__pending_responses:
-                future = self.__pending_responses.pop(sequence)
-                if not future.done():
-                    future.set_result(ws_message_json)
+            future = self.__pending_responses.pop(sequence, None)
+            if future is not None and not future.done():
+                future.set_result(ws_message_json)
 
             action = ws_message_json.get(WS_MSG_ACTION)
             if action == WS_MSG_ACTION_UPDATE:
@@ -116,7 +129,7 @@ class EWeLinkWebSocketClient:
                     if update_entity_available is not None:
                         update_entity_available(deviceid, params.get("online"))
 
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             _LOGGER.error(err, "[EWeLink websocket] handle_ws_message error happen")
 
     async def connect_and_reconnect(self) -> None:
@@ -146,14 +159,16 @@ class EWeLinkWebSocketClient:
                             "ts": int(round(time.time())),
                             "userAgent": WS_USER_AGENT,
                             "version": 8,
-                        }
+                        },
+                        dumps=json_dumps,
                     )
 
                     async for message in ws:
                         if message.type == aiohttp.WSMsgType.TEXT:
-                            _LOGGER.info(
-                                "[EWeLink websocket] message: %s", message.data
-                            )
+                            if _LOGGER.isEnabledFor(logging.INFO):
+                                _LOGGER.info(
+                                    "[EWeLink websocket] message: %s", message.data
+                                )
                             self.__handle_ws_message(message.data)
 
                         elif message.type == aiohttp.WSMsgType.CLOSED:
@@ -213,7 +228,7 @@ class EWeLinkWebSocketClient:
 
     async def control_device(self, ewelink_device: EWeLinkDevice, params: dict):
         """Control EWeLink device."""
-        if (not self.__is_connected) or (ewelink_device is None):
+        if (not self.__is_connected) or (self.__ws is None) or (ewelink_device is None):
             return {"error": -1, "msg": "ws not connect or device is not exist."}
 
         sequence = f"{now_timestamp()}"
@@ -231,25 +246,22 @@ class EWeLinkWebSocketClient:
             "userAgent": WS_USER_AGENT,
         }
 
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("[EWeLink websocket] control device send: %s", command)
+        timer = loop.call_later(10, _expire_future, future)
         try:
-            _LOGGER.info(
-                "[EWeLink websocket] control device send: %s", json.dumps(command)
-            )
-            if self.__ws is not None:
-                await self.__ws.send_json(command)
-                return await asyncio.wait_for(future, timeout=10)
+            await self.__ws.send_json(command, dumps=json_dumps)
+            return await future
         except TimeoutError:
             _LOGGER.error(
                 "[EWeLink websocket] control device timeout. sequence: %s; deviceid: %s; params: %s",
                 sequence,
                 ewelink_device.device_id,
-                json.dumps(params),
+                params,
             )
-            if sequence in self.__pending_responses:
-                self.__pending_responses.pop(sequence)
             return {"error": 408, "sequence": sequence, "msg": "Request Timeout"}
-        else:
-            return None
+        finally:
+            timer.cancel()
 
     @property
     def is_connected(self) -> bool: